@@ -8,6 +8,7 @@ from __future__ import absolute_import, annotations, print_function
 
 import os
 import logging
+import sys
 import types
 from typing import List
 from importlib import reload
@@ -50,7 +51,6 @@ def initializePlugin(plugin):
     """
     global _registered_mel_commands, _first_initialization
     try:
-        import deadline.maya_submitter
         from deadline.maya_submitter import mel_commands, shelf  # type: ignore[import, no-redef]
 
         plugin_obj = om.MFnPlugin(plugin, VENDOR, VERSION)
@@ -59,10 +59,16 @@ def initializePlugin(plugin):
             _first_initialization = False
         else:
             # If a user unloaded and then reloaded the plugin, refresh
-            # some key module dependencies.
-            reload_modules(deadline.job_attachments)
-            reload_modules(deadline.client)
-            reload_modules(deadline.maya_submitter)
+            # some key module dependencies. Some are only imported once a
+            # command has run, so skip the ones that aren't loaded yet.
+            for package_name in [
+                "deadline.job_attachments",
+                "deadline.client",
+                "deadline.maya_submitter",
+            ]:
+                package = sys.modules.get(package_name)
+                if package is not None:
+                    reload_modules(package)
 
         command_name = "DeadlineCloudSubmitter"
         plugin_obj.registerCommand(command_name, mel_commands.DeadlineCloudSubmitterCmd)
@@ -1,9 +1,67 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
 from .default_maya_handler import DefaultMayaHandler
 
+import maya.api.OpenMaya as om  # pylint: disable=import-error
 import maya.cmds
 
+# An ffmpeg glob pattern type compatible prefix for a tile (_tile_<y-coord>x<x_coord>_<numYtiles>x<numXtiles>_<prefix>) where x-coord and y-coord use 1-based indexing
+# ffmpeg takes inputs in sequential order and assembles them from left to right, top to down which is why the Y value needs to be first
+_PREFIX_TMPL = "_tile_%dx%d_%dx%d_%s"
+
+
+# The region attributes in the same order as the tile bounds (left, right, top, bottom)
+_REGION_ATTRIBUTES = (
+    "defaultArnoldRenderOptions.regionMinX",
+    "defaultArnoldRenderOptions.regionMaxX",
+    "defaultArnoldRenderOptions.regionMinY",
+    "defaultArnoldRenderOptions.regionMaxY",
+)
+
+
+def _get_tile_borders(size: int, num_tiles: int) -> list[tuple[int, int]]:
+    """
+    Returns the (min, max) pixel borders of every tile along one axis of the image, in tile order.
+    """
+    delta, remainder = divmod(size, num_tiles)
+
+    # -1 from tilenums for minimums to get the end of the previous tile or 0. This is not done for max values as the max values need to reference the start of the next tile
+    # -1 from max values because Maya uses inclusive ranges and 0 based indexing for coordinates
+    # Any remainder is added to the last row or column, multiplying by the comparison instead of branching on it
+    return [
+        (
+            delta * (tile_num - 1),
+            (delta * tile_num) - 1 + remainder * int(tile_num == num_tiles),
+        )
+        for tile_num in range(1, num_tiles + 1)
+    ]
+
+
+@contextmanager
+def _suspended_dg() -> Iterator[None]:
+    """Turns off the evaluation manager and suspends refreshes for the duration of the block,
+    so that a batch of attribute changes is only propagated once. Restores the old state on exit.
+    Leaving a parallel or serial mode rebuilds the evaluation graph, which is paid once per tile
+    task since the mode is only changed back afterwards."""
+    evaluation_mode = maya.cmds.evaluationManager(query=True, mode=True)[0]
+    refresh_suspended = maya.cmds.refresh(query=True, suspend=True)
+    try:
+        if evaluation_mode != "off":
+            maya.cmds.evaluationManager(mode="off")
+        if not refresh_suspended:
+            maya.cmds.refresh(suspend=True)
+        yield
+    finally:
+        if not refresh_suspended:
+            maya.cmds.refresh(suspend=False)
+        if evaluation_mode != "off":
+            maya.cmds.evaluationManager(mode=evaluation_mode)
+
 
 class ArnoldHandler(DefaultMayaHandler):
     """Render Handler for Arnold"""
@@ -15,6 +73,23 @@ class ArnoldHandler(DefaultMayaHandler):
         super().__init__()
         self.action_dict["error_on_arnold_license_fail"] = self.set_error_on_arnold_license_fail
         self.render_kwargs["batch"] = True
+        # Plugs of the render settings attributes that are used, by "node.attribute" name
+        self._plugs: dict[str, om.MPlug] = {}
+        # Whether the render type and log verbosity have been set for the frames to render
+        self._render_options_ensured = False
+        # The tile parameters that were last prepared, and the region and image prefix they produced
+        self._tile_key: Optional[tuple] = None
+        self._tile_bounds: tuple[int, int, int, int] = (0, 0, 0, 0)
+        self._tile_image_file_prefix = ""
+        # The tile grid that tile borders were last calculated for, and the borders of its tiles
+        self._tile_grid_key: Optional[tuple] = None
+        self._tile_x_borders: list[tuple[int, int]] = []
+        self._tile_y_borders: list[tuple[int, int]] = []
+        # The tile region and image prefix that were last written to the scene
+        self._last_region: Optional[tuple[int, int, int, int]] = None
+        self._last_prefix: Optional[str] = None
+        # The abortOnLicenseFail value that was last written to the scene
+        self._last_abort: Optional[bool] = None
 
     def start_render(self, data: dict) -> None:
         """
@@ -34,82 +109,158 @@ class ArnoldHandler(DefaultMayaHandler):
         self.render_kwargs["camera"] = self.get_camera_to_render(data)
 
         if "width" not in self.render_kwargs:
-            self.render_kwargs["width"] = maya.cmds.getAttr("defaultResolution.width")
-            print(
-                f"No width was specified, defaulting to {self.render_kwargs['width']}",
-                flush=True,
-            )
+            self.render_kwargs["width"] = self._get_plug("defaultResolution.width").asInt()
+            print(f"No width was specified, defaulting to {self.render_kwargs['width']}")
         if "height" not in self.render_kwargs:
-            self.render_kwargs["height"] = maya.cmds.getAttr("defaultResolution.height")
-            print(
-                f"No height was specified, defaulting to {self.render_kwargs['height']}",
-                flush=True,
-            )
-
-        numXTiles = data.get("numXTiles")
-        numYTiles = data.get("numYTiles")
+            self.render_kwargs["height"] = self._get_plug("defaultResolution.height").asInt()
+            print(f"No height was specified, defaulting to {self.render_kwargs['height']}")
 
         # Check if this is a tile rendering job (numXTiles and numYTiles are specified as job parameters)
-        if (numXTiles is not None) and (numYTiles is not None):
-            # Check that numXTiles and numYTiles are integers
-            if (not isinstance(numXTiles, int)) or (not isinstance(numYTiles, int)):
-                raise RuntimeError(
-                    "numXTiles and numYTiles variables from run-data must be integers"
-                )
-
-            # Tile num uses 1 based indexing. First tile (top left) is x=1, y=1
-            tileNumX = data.get("tileNumX")
-            tileNumY = data.get("tileNumY")
-            # Check that tileNumX and tileNumY are integers
-            if (not isinstance(tileNumX, int)) or (not isinstance(tileNumY, int)):
-                raise RuntimeError("tileNumX and tileNumY variables from run-data must be integers")
-
-            deltaX, widthRemainder = divmod(self.render_kwargs["width"], numXTiles)
-            deltaY, heightRemainder = divmod(self.render_kwargs["height"], numYTiles)
-
-            # Calculate the border values for the tile
-            # -1 from tilenums for minimums to get the end of the previous tile or 0. This is not done for max values as the max values need to reference the start of the next tile
-            # -1 from max values because Maya uses inclusive ranges and 0 based indexing for coordinates
-            # minX = left, maxX = right, minY = top, maxY = bottom
-            minX = deltaX * (tileNumX - 1)
-            maxX = (deltaX * tileNumX) - 1
-            minY = deltaY * (tileNumY - 1)
-            maxY = (deltaY * tileNumY) - 1
-
-            # Add any remainder to the last row and column
-            if tileNumX == numXTiles:
-                maxX += widthRemainder
-            if tileNumY == numYTiles:
-                maxY += heightRemainder
-
-            # Set the border ranges for the tile (left, right, top, bottom)
-            maya.cmds.setAttr("defaultArnoldRenderOptions.regionMinX", minX)
-            maya.cmds.setAttr("defaultArnoldRenderOptions.regionMaxX", maxX)
-            maya.cmds.setAttr("defaultArnoldRenderOptions.regionMinY", minY)
-            maya.cmds.setAttr("defaultArnoldRenderOptions.regionMaxY", maxY)
-            print(f"minX={minX}, maxX={maxX}, minY={minY}, maxY={maxY}")
-
-            prefix = data.get("output_file_prefix")
-
-            # Set an ffmpeg glob pattern type compatible prefix for the tile (_tile_<y-coord>x<x_coord>_<numYtiles>x<numXtiles>_<prefix>) where x-coord and y-coord use 1-based indexing
-            # This command takes inputs in sequential order and assembles them from left to right, top to down which is why the Y value needs to be first
-            maya.cmds.setAttr(
-                "defaultRenderGlobals.imageFilePrefix",
-                f"_tile_{tileNumY}x{tileNumX}_{numYTiles}x{numXTiles}_{prefix}",
-                type="string"
-            )
+        if "numXTiles" in data and "numYTiles" in data:
+            self._apply_tile_region(data)
 
-            print(f'Output file name: {maya.cmds.getAttr("defaultRenderGlobals.imageFilePrefix")}')
+        if not self._render_options_ensured:
+            self._ensure_render_options()
 
+        maya.cmds.arnoldRender(**self.render_kwargs)
+        print(f"MayaClient: Finished Rendering Frame {frame}\n", flush=True)
+
+    def _ensure_render_options(self) -> None:
+        """
+        Sets the Arnold render options that every frame needs. Nothing changes them between
+        frames, so this only has to run before the first frame is rendered.
+        """
         # Set the arnold render type so that we don't just make .ass files, but the actual image
-        maya.cmds.setAttr("defaultArnoldRenderOptions.renderType", 0)
+        self._get_plug("defaultArnoldRenderOptions.renderType").setInt(0)
 
         # Set the log verbosity high enough that we get progress reporting output
-        if maya.cmds.getAttr("defaultArnoldRenderOptions.log_verbosity") < 2:
-            maya.cmds.setAttr("defaultArnoldRenderOptions.log_verbosity", 2)
+        log_verbosity_plug = self._get_plug("defaultArnoldRenderOptions.log_verbosity")
+        if log_verbosity_plug.asInt() < 2:
+            log_verbosity_plug.setInt(2)
 
-        maya.cmds.arnoldRender(**self.render_kwargs)
-        print(f"MayaClient: Finished Rendering Frame {frame}\n", flush=True)
+        self._render_options_ensured = True
+
+    def _apply_tile_region(self, data: dict) -> None:
+        """
+        Sets the render region and image file prefix of the tile being rendered.
+
+        Args:
+            data (dict): The data given from the Adaptor. Keys expected:
+                ['numXTiles', 'numYTiles', 'tileNumX', 'tileNumY']
+                Optional keys: ['output_file_prefix']
+
+        Raises:
+            RuntimeError: If the tile parameters are not integers, or the tile is not in the grid
+        """
+        self._prepare_tile_params(data)
+
+        # Writing the same values again would only dirty the dependency graph, so skip them
+        # when unchanged
+        region_changed = self._tile_bounds != self._last_region
+        prefix_changed = self._tile_image_file_prefix != self._last_prefix
+        if region_changed or prefix_changed:
+            with _suspended_dg():
+                if region_changed:
+                    # Set the border ranges for the tile (left, right, top, bottom)
+                    for attribute, value in zip(_REGION_ATTRIBUTES, self._tile_bounds):
+                        self._get_plug(attribute).setInt(value)
+                    self._last_region = self._tile_bounds
+                if prefix_changed:
+                    self._get_plug("defaultRenderGlobals.imageFilePrefix").setString(
+                        self._tile_image_file_prefix
+                    )
+                    self._last_prefix = self._tile_image_file_prefix
+
+    def _get_plug(self, attribute: str) -> om.MPlug:
+        """
+        Returns the plug for a "node.attribute" name. Plugs are looked up the first time they are
+        needed rather than when the handler is created, since the scene is opened after that.
+        """
+        plug = self._plugs.get(attribute)
+        if plug is None:
+            node_name, attribute_name = attribute.split(".", 1)
+            selection = om.MSelectionList()
+            selection.add(node_name)
+            node = om.MFnDependencyNode(selection.getDependNode(0))
+            plug = node.findPlug(attribute_name, False)
+            self._plugs[attribute] = plug
+        return plug
+
+    def _prepare_tile_params(self, data: dict) -> None:
+        """
+        Validates the tile parameters of a tile render, then calculates the region of its tile
+        into self._tile_bounds and the image file prefix into self._tile_image_file_prefix.
+        The parameters are the same for every frame of a task, so this only does the work
+        when they change.
+
+        Args:
+            data (dict): The data given from the Adaptor. Keys expected:
+                ['numXTiles', 'numYTiles', 'tileNumX', 'tileNumY']
+                Optional keys: ['output_file_prefix']
+
+        Raises:
+            RuntimeError: If the tile parameters are not integers, or the tile is not in the grid
+        """
+        numXTiles = data.get("numXTiles")
+        numYTiles = data.get("numYTiles")
+        # Tile num uses 1 based indexing. First tile (top left) is x=1, y=1
+        tileNumX = data.get("tileNumX")
+        tileNumY = data.get("tileNumY")
+        prefix = data.get("output_file_prefix")
+        width = self.render_kwargs["width"]
+        height = self.render_kwargs["height"]
+
+        tile_key = (
+            width,
+            height,
+            numXTiles,
+            numYTiles,
+            tileNumX,
+            tileNumY,
+            prefix,
+        )
+        if tile_key == self._tile_key:
+            return
+
+        # Check that numXTiles and numYTiles are integers
+        if (not isinstance(numXTiles, int)) or (not isinstance(numYTiles, int)):
+            raise RuntimeError("numXTiles and numYTiles variables from run-data must be integers")
+
+        # Check that tileNumX and tileNumY are integers
+        if (not isinstance(tileNumX, int)) or (not isinstance(tileNumY, int)):
+            raise RuntimeError("tileNumX and tileNumY variables from run-data must be integers")
+
+        # Tile num uses 1 based indexing, so the last tile num is also the number of tiles
+        if not (1 <= tileNumX <= numXTiles) or not (1 <= tileNumY <= numYTiles):
+            raise RuntimeError(
+                "tileNumX and tileNumY variables from run-data must be between 1 and "
+                "numXTiles and numYTiles"
+            )
+
+        # The borders of every tile in the grid are calculated together, so that tasks
+        # rendering the other tiles of the same image only need to look theirs up
+        grid_key = tile_key[:4]
+        if grid_key != self._tile_grid_key:
+            self._tile_x_borders = _get_tile_borders(width, numXTiles)
+            self._tile_y_borders = _get_tile_borders(height, numYTiles)
+            self._tile_grid_key = grid_key
+
+        # minX = left, maxX = right, minY = top, maxY = bottom
+        minX, maxX = self._tile_x_borders[tileNumX - 1]
+        minY, maxY = self._tile_y_borders[tileNumY - 1]
+
+        print(f"minX={minX}, maxX={maxX}, minY={minY}, maxY={maxY}")
+        self._tile_bounds = (minX, maxX, minY, maxY)
+
+        self._tile_image_file_prefix = _PREFIX_TMPL % (
+            tileNumY,
+            tileNumX,
+            numYTiles,
+            numXTiles,
+            prefix,
+        )
+        print(f"Output file name: {self._tile_image_file_prefix}")
+        self._tile_key = tile_key
 
     def set_error_on_arnold_license_fail(self, data: dict) -> None:
         """
@@ -120,8 +271,10 @@ class ArnoldHandler(DefaultMayaHandler):
             data (dict): : The data given from the Adaptor. Keys expected:
                 ['error_on_arnold_license_fail']
         """
-        val = data.get("error_on_arnold_license_fail", True)
-        maya.cmds.setAttr("defaultArnoldRenderOptions.abortOnLicenseFail", val)
+        val = bool(data.get("error_on_arnold_license_fail", True))
+        if val != self._last_abort:
+            self._get_plug("defaultArnoldRenderOptions.abortOnLicenseFail").setBool(val)
+            self._last_abort = val
 
     def set_render_layer(self, data: dict) -> None:
         """
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import dataclasses
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Optional
 import json
 
 from .cameras import ALL_CAMERAS
@@ -12,6 +14,21 @@ from .render_layers import LayerSelection  # type: ignore
 RENDER_SUBMITTER_SETTINGS_FILE_EXT = ".deadline_render_settings.json"
 
 
+def read_sticky_settings_file(scene_filename: str) -> Any:
+    """
+    Reads the sticky settings file saved next to a scene. This does no Maya calls, so it is
+    safe to run on a background thread.
+
+    Returns the parsed JSON, or None if there is no sticky settings file for the scene.
+    Raises OSError or json.JSONDecodeError if the file could not be read.
+    """
+    sticky_settings_filename = Path(scene_filename).with_suffix(RENDER_SUBMITTER_SETTINGS_FILE_EXT)
+    if sticky_settings_filename.exists() and sticky_settings_filename.is_file():
+        with open(sticky_settings_filename, encoding="utf8") as fh:
+            return json.load(fh)
+    return None
+
+
 @dataclass
 class RenderSubmitterUISettings:
     """
@@ -40,44 +57,56 @@ class RenderSubmitterUISettings:
     # developer options
     include_adaptor_wheels: bool = field(default=False, metadata={"sticky": True})
 
-    def load_sticky_settings(self, scene_filename: str):
-        sticky_settings_filename = Path(scene_filename).with_suffix(
-            RENDER_SUBMITTER_SETTINGS_FILE_EXT
-        )
-        if sticky_settings_filename.exists() and sticky_settings_filename.is_file():
-            try:
-                with open(sticky_settings_filename, encoding="utf8") as fh:
-                    sticky_settings = json.load(fh)
-
-                if isinstance(sticky_settings, dict):
-                    sticky_fields = {
-                        field.name: field
-                        for field in dataclasses.fields(self)
-                        if field.metadata.get("sticky")
-                    }
-                    for name, value in sticky_settings.items():
-                        # Only set fields that are defined in the dataclass
-                        if name in sticky_fields:
-                            setattr(self, name, value)
-            except (OSError, json.JSONDecodeError):
-                # If something bad happened to the sticky settings file,
-                # just use the defaults instead of producing an error.
-                import traceback
-
-                traceback.print_exc()
-                print(
-                    f"WARNING: Failed to load sticky settings file {sticky_settings_filename}, reverting to the default settings."
-                )
-                pass
+    def load_sticky_settings(
+        self, scene_filename: str, sticky_settings_read: Optional[Future] = None
+    ):
+        """
+        Loads the sticky settings for the scene into this object.
+
+        Args:
+            scene_filename (str): The scene the sticky settings were saved for.
+            sticky_settings_read (Future, optional): A read_sticky_settings_file call for the
+                scene that was started earlier, e.g. on a background thread. If not provided
+                the file is read here.
+        """
+        try:
+            if sticky_settings_read is None:
+                sticky_settings = read_sticky_settings_file(scene_filename)
+            else:
+                sticky_settings = sticky_settings_read.result()
+
+            if isinstance(sticky_settings, dict):
+                for name, value in sticky_settings.items():
+                    # Only set fields that are defined in the dataclass
+                    if name in _STICKY_FIELD_NAMES:
+                        setattr(self, name, value)
+        except (OSError, json.JSONDecodeError):
+            # If something bad happened to the sticky settings file,
+            # just use the defaults instead of producing an error.
+            import traceback
+
+            traceback.print_exc()
+            sticky_settings_filename = Path(scene_filename).with_suffix(
+                RENDER_SUBMITTER_SETTINGS_FILE_EXT
+            )
+            print(
+                f"WARNING: Failed to load sticky settings file {sticky_settings_filename}, reverting to the default settings."
+            )
+            pass
 
     def save_sticky_settings(self, scene_filename: str):
         sticky_settings_filename = Path(scene_filename).with_suffix(
             RENDER_SUBMITTER_SETTINGS_FILE_EXT
         )
+        obj = {name: getattr(self, name) for name in _STICKY_FIELD_NAMES}
+        # Encode the whole document before opening the file, so it is written in one call and an
+        # encoding error can't leave a truncated settings file behind
+        sticky_settings = json.dumps(obj, indent=1)
         with open(sticky_settings_filename, "w", encoding="utf8") as fh:
-            obj = {
-                field.name: getattr(self, field.name)
-                for field in dataclasses.fields(self)
-                if field.metadata.get("sticky")
-            }
-            json.dump(obj, fh, indent=1)
+            fh.write(sticky_settings)
+
+
+# The names of the sticky fields, in declaration order
+_STICKY_FIELD_NAMES = tuple(
+    f.name for f in dataclasses.fields(RenderSubmitterUISettings) if f.metadata.get("sticky")
+)
@@ -16,11 +16,14 @@ from pathlib import Path
 from datetime import datetime, timezone
 
 import maya.cmds
+import maya.OpenMayaUI as omui  # pylint: disable=import-error
 from PySide2.QtWidgets import (  # pylint: disable=import-error; type: ignore
     QApplication,
     QFileDialog,
     QMessageBox,
+    QWidget,
 )
+from shiboken2 import wrapInstance  # pylint: disable=import-error
 
 from deadline.client.ui import gui_error_handler
 from deadline.client.ui.dialogs import submit_job_to_deadline_dialog
@@ -50,8 +53,7 @@ def _consistent_machine_settings():
 
 
 def _get_dcc_main_window() -> Any:
-    app = QApplication.instance()
-    return [widget for widget in app.topLevelWidgets() if widget.objectName() == "MayaWindow"][0]
+    return wrapInstance(int(omui.MQtUtil.mainWindow()), QWidget)
 
 
 def _open_dcc_scene_file(filename: str):
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from pathlib import Path
 from typing import Any, Optional
@@ -25,6 +26,7 @@ from .assets import AssetIntrospector
 from .renderers import get_output_prefix_with_tokens, get_height, get_width
 from .data_classes import (
     RenderSubmitterUISettings,
+    read_sticky_settings_file,
 )
 from .render_layers import (
     saved_current_render_layer,
@@ -446,17 +448,22 @@ def show_maya_render_submitter(parent, f=Qt.WindowFlags()) -> "Optional[SubmitJo
     with open(Path(__file__).parent / "default_maya_job_template.yaml") as fh:
         default_job_template = yaml.safe_load(fh)
 
+    scene_name = Scene.name()
+
+    # Start reading the sticky settings file in the background, so that it overlaps with
+    # introspecting the render layers and assets of the scene below
+    executor = ThreadPoolExecutor(max_workers=1)
+    sticky_settings_read = executor.submit(read_sticky_settings_file, scene_name)
+    executor.shutdown(wait=False)
+
     render_settings = RenderSubmitterUISettings()
 
     # Set the setting defaults that come from the scene
-    render_settings.name = Path(Scene.name()).name
+    render_settings.name = Path(scene_name).name
     render_settings.frame_list = str(Animation.frame_list())
     render_settings.project_path = Scene.project_path()
     render_settings.output_path = Scene.output_path()
 
-    # Load the sticky settings
-    render_settings.load_sticky_settings(Scene.name())
-
     # Create a dictionary for the layers, and accumulate data about each layer
     render_layer_names = get_all_renderable_render_layer_names()
     if not render_layer_names:
@@ -636,6 +643,9 @@ def show_maya_render_submitter(parent, f=Qt.WindowFlags()) -> "Optional[SubmitJo
     for layer_data in render_layers:
         auto_detected_attachments.output_directories.update(layer_data.output_directories)
 
+    # Load the sticky settings
+    render_settings.load_sticky_settings(scene_name, sticky_settings_read)
+
     attachments = AssetReferences(
         input_filenames=set(render_settings.input_filenames),
         input_directories=set(render_settings.input_directories),
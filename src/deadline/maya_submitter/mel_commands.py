@@ -3,17 +3,49 @@
 """
 Defines the Render submitter command which is registered in Maya.
 """
+import functools
+from contextlib import contextmanager
+from typing import Iterator
+
 import maya.api.OpenMaya as om  # pylint: disable=import-error
 import maya.cmds
-from PySide2.QtCore import Qt  # pylint: disable=import-error
-from PySide2.QtWidgets import (  # pylint: disable=import-error; type: ignore
-    QApplication,
-)
 
+from deadline.client.exceptions import DeadlineOperationError
 from deadline.client.ui import gui_error_handler
 from . import logger as deadline_logger  # type: ignore
-from .maya_render_submitter import show_maya_render_submitter
-from .job_bundle_output_test_runner import run_maya_render_submitter_job_bundle_output_test
+
+# The Qt and submitter modules are imported when a command runs rather than here, so that
+# loading the plug-in at Maya startup does not pay for importing the whole submitter UI.
+
+_LIBSSL_IMPORT_ERROR = "cannot import name 'ssl' from 'urllib3.util.ssl_'"
+
+
+@contextmanager
+def _explain_known_import_errors() -> Iterator[None]:
+    """
+    Replaces import errors with a known cause by an error that explains it. The submitter
+    modules are imported when a command runs, so this is where those errors show up.
+    """
+    try:
+        yield
+    except ImportError as e:
+        if _LIBSSL_IMPORT_ERROR in str(e.msg):
+            raise DeadlineOperationError(
+                "Deadline Cloud Submitter could not load due to a known issue where Maya does not "
+                "link libssl and libcrypto on some operating systems. Please see the following link"
+                " for more information:\n"
+                "https://github.com/aws-deadline/deadline-cloud-for-maya/issues/133"
+            ) from e
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def _is_ui_mode() -> bool:
+    """
+    Returns whether Maya is running with a UI. This can't change during a session, so Maya is
+    only asked once.
+    """
+    return om.MGlobal.mayaState() in (om.MGlobal.kInteractive, om.MGlobal.kBaseUIMode)
 
 
 class DeadlineCloudSubmitterCmd(om.MPxCommand):
@@ -33,13 +65,18 @@ class DeadlineCloudSubmitterCmd(om.MPxCommand):
         """
 
         # Build the GUI if we are in UI mode
-        if om.MGlobal.mayaState() in [om.MGlobal.kInteractive, om.MGlobal.kBaseUIMode]:
+        if _is_ui_mode():
+            import maya.OpenMayaUI as omui  # pylint: disable=import-error
+            from PySide2.QtCore import Qt  # pylint: disable=import-error
+            from PySide2.QtWidgets import QWidget  # pylint: disable=import-error; type: ignore
+            from shiboken2 import wrapInstance  # pylint: disable=import-error
+
             # Get the main Maya window so we can parent the submitter to it
-            app = QApplication.instance()
-            mainwin = [
-                widget for widget in app.topLevelWidgets() if widget.objectName() == "MayaWindow"
-            ][0]
+            mainwin = wrapInstance(int(omui.MQtUtil.mainWindow()), QWidget)
             with gui_error_handler("Error opening the Deadline Cloud Submitter", mainwin):
+                with _explain_known_import_errors():
+                    from .maya_render_submitter import show_maya_render_submitter
+
                 logger = deadline_logger()
 
                 logger.info("Opening AWS Deadline Cloud Submitter")
@@ -79,4 +116,9 @@ class DeadlineCloudJobBundleOutputTestsCmd(om.MPxCommand):
         """
         Runs a set of job bundle output tests from a directory.
         """
+        with _explain_known_import_errors():
+            from .job_bundle_output_test_runner import (
+                run_maya_render_submitter_job_bundle_output_test,
+            )
+
         run_maya_render_submitter_job_bundle_output_test()
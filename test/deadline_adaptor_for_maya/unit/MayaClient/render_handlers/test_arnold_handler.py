@@ -1,11 +1,39 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 from __future__ import annotations
 
-from typing import Any
+from collections import defaultdict
+from typing import Any, Generator
+from unittest.mock import Mock, call, patch
 
+import maya.cmds
 import pytest
 
-from deadline.maya_adaptor.MayaClient.render_handlers.arnold_handler import ArnoldHandler
+from deadline.maya_adaptor.MayaClient.render_handlers.arnold_handler import (
+    ArnoldHandler,
+    _get_tile_borders,
+)
+
+
+@pytest.fixture()
+def plugs() -> Generator[dict[str, Mock], None, None]:
+    """Replaces the render settings plugs with mocks, by "node.attribute" name"""
+    mock_plugs: dict[str, Mock] = defaultdict(Mock)
+    mock_plugs["defaultArnoldRenderOptions.log_verbosity"].asInt.return_value = 2
+    with patch.object(ArnoldHandler, "_get_plug", side_effect=mock_plugs.__getitem__):
+        yield mock_plugs
+
+
+@pytest.mark.parametrize(
+    "size, num_tiles, expected_borders",
+    [
+        (640, 1, [(0, 639)]),
+        (640, 2, [(0, 319), (320, 639)]),
+        (1001, 3, [(0, 332), (333, 665), (666, 1000)]),
+    ],
+)
+def test_get_tile_borders(size: int, num_tiles: int, expected_borders: list) -> None:
+    """Tests that the tile borders cover the whole axis, with the remainder in the last tile"""
+    assert _get_tile_borders(size, num_tiles) == expected_borders
 
 
 class TestArnoldHandler:
@@ -47,3 +75,247 @@ class TestArnoldHandler:
 
         # THEN
         assert handler.render_kwargs["width"] == args["image_width"]
+
+    @patch.object(maya.cmds, "arnoldRender")
+    @patch.object(ArnoldHandler, "get_camera_to_render", return_value="persp")
+    def test_start_render_tile(
+        self, mock_get_camera: Mock, mock_arnold_render: Mock, plugs: dict[str, Mock]
+    ) -> None:
+        """Tests that a tile render writes its region and prefix to the render settings plugs"""
+        # GIVEN
+        handler = ArnoldHandler()
+        handler.set_image_width({"image_width": 1001})
+        handler.set_image_height({"image_height": 500})
+        data = {
+            "frame": 1,
+            "numXTiles": 2,
+            "numYTiles": 2,
+            "tileNumX": 2,
+            "tileNumY": 1,
+            "output_file_prefix": "beauty",
+        }
+
+        # WHEN
+        handler.start_render(data)
+
+        # THEN
+        plugs["defaultArnoldRenderOptions.regionMinX"].setInt.assert_called_once_with(500)
+        plugs["defaultArnoldRenderOptions.regionMaxX"].setInt.assert_called_once_with(1000)
+        plugs["defaultArnoldRenderOptions.regionMinY"].setInt.assert_called_once_with(0)
+        plugs["defaultArnoldRenderOptions.regionMaxY"].setInt.assert_called_once_with(249)
+        plugs["defaultRenderGlobals.imageFilePrefix"].setString.assert_called_once_with(
+            "_tile_1x2_2x2_beauty"
+        )
+        plugs["defaultArnoldRenderOptions.renderType"].setInt.assert_called_once_with(0)
+        mock_arnold_render.assert_called_once_with(
+            batch=True, width=1001, height=500, seq=1, camera="persp"
+        )
+
+    @patch.object(maya.cmds, "arnoldRender")
+    @patch.object(ArnoldHandler, "get_camera_to_render", return_value="persp")
+    def test_start_render_ensures_render_options_once(
+        self, mock_get_camera: Mock, mock_arnold_render: Mock, plugs: dict[str, Mock]
+    ) -> None:
+        """Tests that the render type and log verbosity are only set before the first frame"""
+        # GIVEN
+        handler = ArnoldHandler()
+        handler.set_image_width({"image_width": 640})
+        handler.set_image_height({"image_height": 480})
+        plugs["defaultArnoldRenderOptions.log_verbosity"].asInt.return_value = 1
+
+        # WHEN
+        handler.start_render({"frame": 1})
+        handler.start_render({"frame": 2})
+
+        # THEN
+        plugs["defaultArnoldRenderOptions.renderType"].setInt.assert_called_once_with(0)
+        plugs["defaultArnoldRenderOptions.log_verbosity"].asInt.assert_called_once_with()
+        plugs["defaultArnoldRenderOptions.log_verbosity"].setInt.assert_called_once_with(2)
+
+    @patch.object(maya.cmds, "arnoldRender")
+    @patch.object(ArnoldHandler, "get_camera_to_render", return_value="persp")
+    def test_start_render_tile_layout_calculated_once(
+        self,
+        mock_get_camera: Mock,
+        mock_arnold_render: Mock,
+        plugs: dict[str, Mock],
+        capsys: pytest.CaptureFixture,
+    ) -> None:
+        """Tests that the tile layout is only calculated again when the tile changes"""
+        # GIVEN
+        handler = ArnoldHandler()
+        handler.set_image_width({"image_width": 640})
+        handler.set_image_height({"image_height": 480})
+        data = {"numXTiles": 2, "numYTiles": 2, "tileNumX": 1, "tileNumY": 1}
+
+        # WHEN
+        handler.start_render({"frame": 1, **data})
+        handler.start_render({"frame": 2, **data})
+        handler.start_render({"frame": 2, **data, "tileNumY": 2})
+
+        # THEN
+        output = capsys.readouterr().out
+        assert output.count("minX=0, maxX=319, minY=0, maxY=239") == 1
+        assert output.count("minX=0, maxX=319, minY=240, maxY=479") == 1
+
+    @patch.object(maya.cmds, "arnoldRender")
+    @patch.object(ArnoldHandler, "get_camera_to_render", return_value="persp")
+    def test_start_render_tile_skips_unchanged_attributes(
+        self, mock_get_camera: Mock, mock_arnold_render: Mock, plugs: dict[str, Mock]
+    ) -> None:
+        """Tests that the tile region and prefix are not written again when they are unchanged"""
+        # GIVEN
+        handler = ArnoldHandler()
+        handler.set_image_width({"image_width": 640})
+        handler.set_image_height({"image_height": 480})
+        data = {"numXTiles": 2, "numYTiles": 2, "tileNumX": 1, "tileNumY": 1}
+
+        # WHEN
+        handler.start_render({"frame": 1, **data})
+        handler.start_render({"frame": 2, **data})
+
+        # THEN
+        plugs["defaultArnoldRenderOptions.regionMinX"].setInt.assert_called_once_with(0)
+        plugs["defaultRenderGlobals.imageFilePrefix"].setString.assert_called_once()
+
+    @patch.object(maya.cmds, "arnoldRender")
+    @patch.object(maya.cmds, "refresh", return_value=False)
+    @patch.object(maya.cmds, "evaluationManager", return_value=["parallel"])
+    @patch.object(ArnoldHandler, "get_camera_to_render", return_value="persp")
+    def test_start_render_tile_suspends_dg(
+        self,
+        mock_get_camera: Mock,
+        mock_evaluation_manager: Mock,
+        mock_refresh: Mock,
+        mock_arnold_render: Mock,
+        plugs: dict[str, Mock],
+    ) -> None:
+        """Tests that the tile attributes are set with the evaluation manager and refresh suspended"""
+        # GIVEN
+        handler = ArnoldHandler()
+        handler.set_image_width({"image_width": 640})
+        handler.set_image_height({"image_height": 480})
+        data = {"numXTiles": 2, "numYTiles": 2, "tileNumX": 1, "tileNumY": 1}
+
+        # WHEN
+        handler.start_render({"frame": 1, **data})
+
+        # THEN
+        mock_evaluation_manager.assert_has_calls(
+            [call(query=True, mode=True), call(mode="off"), call(mode="parallel")]
+        )
+        mock_refresh.assert_has_calls(
+            [call(query=True, suspend=True), call(suspend=True), call(suspend=False)]
+        )
+
+    @patch.object(maya.cmds, "arnoldRender")
+    @patch.object(maya.cmds, "refresh", return_value=True)
+    @patch.object(maya.cmds, "evaluationManager", return_value=["off"])
+    @patch.object(ArnoldHandler, "get_camera_to_render", return_value="persp")
+    def test_start_render_tile_keeps_dg_state(
+        self,
+        mock_get_camera: Mock,
+        mock_evaluation_manager: Mock,
+        mock_refresh: Mock,
+        mock_arnold_render: Mock,
+        plugs: dict[str, Mock],
+    ) -> None:
+        """Tests that an evaluation manager that is already off and a refresh that is already
+        suspended are left alone"""
+        # GIVEN
+        handler = ArnoldHandler()
+        handler.set_image_width({"image_width": 640})
+        handler.set_image_height({"image_height": 480})
+        data = {"numXTiles": 2, "numYTiles": 2, "tileNumX": 1, "tileNumY": 1}
+
+        # WHEN
+        handler.start_render({"frame": 1, **data})
+
+        # THEN
+        mock_evaluation_manager.assert_called_once_with(query=True, mode=True)
+        mock_refresh.assert_called_once_with(query=True, suspend=True)
+
+    @pytest.mark.parametrize("tile_nums", [(0, 1), (1, 3)])
+    @patch.object(ArnoldHandler, "get_camera_to_render", return_value="persp")
+    def test_start_render_tile_out_of_range(
+        self, mock_get_camera: Mock, tile_nums: tuple[int, int]
+    ) -> None:
+        """Tests that a tile outside of the tile grid is rejected"""
+        # GIVEN
+        handler = ArnoldHandler()
+        handler.set_image_width({"image_width": 640})
+        handler.set_image_height({"image_height": 480})
+        data = {
+            "frame": 1,
+            "numXTiles": 2,
+            "numYTiles": 2,
+            "tileNumX": tile_nums[0],
+            "tileNumY": tile_nums[1],
+        }
+
+        # WHEN
+        with pytest.raises(RuntimeError) as exc_info:
+            handler.start_render(data)
+
+        # THEN
+        assert "must be between 1 and numXTiles and numYTiles" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        "tile_params, expected_error",
+        [
+            ({"numXTiles": "2", "numYTiles": 2, "tileNumX": 1, "tileNumY": 1}, "numXTiles"),
+            ({"numXTiles": 2, "numYTiles": 2, "tileNumX": 1, "tileNumY": None}, "tileNumX"),
+        ],
+    )
+    def test_prepare_tile_params_not_integers(
+        self, tile_params: dict[str, Any], expected_error: str
+    ) -> None:
+        """Tests that tile parameters that are not integers are rejected"""
+        # GIVEN
+        handler = ArnoldHandler()
+        handler.set_image_width({"image_width": 640})
+        handler.set_image_height({"image_height": 480})
+
+        # WHEN
+        with pytest.raises(RuntimeError) as exc_info:
+            handler._prepare_tile_params(tile_params)
+
+        # THEN
+        assert str(exc_info.value).startswith(expected_error)
+
+    @patch.object(maya.cmds, "arnoldRender")
+    @patch.object(ArnoldHandler, "get_camera_to_render", return_value="persp")
+    def test_start_render_default_resolution(
+        self, mock_get_camera: Mock, mock_arnold_render: Mock, plugs: dict[str, Mock]
+    ) -> None:
+        """Tests that the scene resolution is read once when no resolution was specified"""
+        # GIVEN
+        handler = ArnoldHandler()
+        plugs["defaultResolution.width"].asInt.return_value = 1920
+        plugs["defaultResolution.height"].asInt.return_value = 1080
+
+        # WHEN
+        handler.start_render({"frame": 1})
+        handler.start_render({"frame": 2})
+
+        # THEN
+        plugs["defaultResolution.width"].asInt.assert_called_once_with()
+        plugs["defaultResolution.height"].asInt.assert_called_once_with()
+        assert handler.render_kwargs["width"] == 1920
+        assert handler.render_kwargs["height"] == 1080
+
+    def test_set_error_on_arnold_license_fail_skips_unchanged(self, plugs: dict[str, Mock]) -> None:
+        """Tests that abortOnLicenseFail is only written when its value changes"""
+        # GIVEN
+        handler = ArnoldHandler()
+
+        # WHEN
+        handler.set_error_on_arnold_license_fail({"error_on_arnold_license_fail": False})
+        handler.set_error_on_arnold_license_fail({"error_on_arnold_license_fail": False})
+        handler.set_error_on_arnold_license_fail({"error_on_arnold_license_fail": True})
+
+        # THEN
+        assert plugs["defaultArnoldRenderOptions.abortOnLicenseFail"].setBool.call_args_list == [
+            call(False),
+            call(True),
+        ]
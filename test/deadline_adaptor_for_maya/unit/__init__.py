@@ -4,5 +4,5 @@ import sys
 from unittest.mock import MagicMock
 
 # Mock the modules that code under test uses
-for module in ["maya", "maya.cmds", "maya.mel", "maya.standalone"]:
+for module in ["maya", "maya.api", "maya.api.OpenMaya", "maya.cmds", "maya.mel", "maya.standalone"]:
     sys.modules[module] = MagicMock()
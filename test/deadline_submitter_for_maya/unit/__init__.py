@@ -13,13 +13,16 @@ mock_modules = [
     "maya.app.general.fileTexturePathResolver",
     "maya.app.general.mayaMixin",
     "maya.OpenMaya",
+    "maya.OpenMayaUI",
     "maya.cmds",
+    "maya.mel",
     "maya.utils",
     "PySide2",
     "PySide2.QtCore",
     "PySide2.QtGui",
     "PySide2.QtWidgets",
     "mtoa.core",
+    "shiboken2",
     "qtpy",
     "qtpy.QtCore",
     "qtpy.QtWidgets",
@@ -2,6 +2,7 @@
 
 import os
 import re
+import sys
 from collections import namedtuple
 from typing import Any
 from unittest.mock import Mock, call, patch
@@ -106,3 +107,30 @@ def test_initialize_plugin_exc(mock_reload: Mock, mock_confirm_dialog: Mock) ->
             button="OK",
             defaultButton="OK",
         )
+
+
+@patch.object(om.MGlobal, "mayaState")
+@patch.object(om, "MFnPlugin")
+@patch.object(DeadlineCloudForMaya, "reload_modules")
+@patch.dict(os.environ, {"DEADLINE_ENABLE_DEVELOPER_OPTIONS": "False"})
+def test_initialize_plugin_reload_skips_unloaded_packages(
+    mock_reload_modules: Mock,
+    mock_MFnPlugin: Mock,
+    mock_mayaState: Mock,
+) -> None:
+    # GIVEN
+    mock_mayaState.return_value = om.MGlobal.kBatch
+    with (
+        patch.object(DeadlineCloudForMaya, "_first_initialization", False),
+        patch.dict(sys.modules),
+    ):
+        sys.modules.pop("deadline.job_attachments", None)
+
+        # WHEN
+        DeadlineCloudForMaya.initializePlugin(Mock())
+
+        # THEN
+        mock_reload_modules.assert_has_calls(
+            [call(sys.modules["deadline.client"]), call(sys.modules["deadline.maya_submitter"])]
+        )
+        assert mock_reload_modules.call_count == 2
@@ -0,0 +1,152 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from deadline.maya_submitter.data_classes import (
+    RenderSubmitterUISettings,
+    _STICKY_FIELD_NAMES,
+    read_sticky_settings_file,
+)
+
+STICKY_FIELD_NAMES = (
+    "name",
+    "description",
+    "override_frame_range",
+    "frame_list",
+    "input_filenames",
+    "input_directories",
+    "output_directories",
+    "include_adaptor_wheels",
+)
+
+
+def _completed_future(result: Any = None, exception: Exception | None = None) -> Future:
+    future: Future = Future()
+    if exception is None:
+        future.set_result(result)
+    else:
+        future.set_exception(exception)
+    return future
+
+
+def test_sticky_field_names():
+    """Tests that the sticky fields are listed in declaration order"""
+    assert _STICKY_FIELD_NAMES == STICKY_FIELD_NAMES
+
+
+def test_read_sticky_settings_file_missing(tmp_path: Path):
+    """Tests that a scene without a sticky settings file reads as None"""
+    # WHEN
+    result = read_sticky_settings_file(str(tmp_path / "scene.mb"))
+
+    # THEN
+    assert result is None
+
+
+def test_load_sticky_settings_not_a_dict(tmp_path: Path):
+    """Tests that a sticky settings file that isn't a JSON object is ignored"""
+    # GIVEN
+    scene_filename = str(tmp_path / "scene.mb")
+    (tmp_path / "scene.deadline_render_settings.json").write_text('["name"]', encoding="utf8")
+    settings = RenderSubmitterUISettings()
+
+    # WHEN
+    settings.load_sticky_settings(scene_filename)
+
+    # THEN
+    assert settings == RenderSubmitterUISettings()
+
+
+@pytest.mark.parametrize(
+    "exception", [OSError("cannot read"), json.JSONDecodeError("bad json", "{", 1)]
+)
+def test_load_sticky_settings_read_failed(tmp_path: Path, capsys, exception: Exception):
+    """Tests that a failed read keeps the default settings and prints a warning"""
+    # GIVEN
+    scene_filename = str(tmp_path / "scene.mb")
+    settings = RenderSubmitterUISettings()
+
+    # WHEN
+    settings.load_sticky_settings(scene_filename, _completed_future(exception=exception))
+
+    # THEN
+    assert settings == RenderSubmitterUISettings()
+    expected_filename = tmp_path / "scene.deadline_render_settings.json"
+    assert (
+        f"WARNING: Failed to load sticky settings file {expected_filename}, reverting to the "
+        "default settings." in capsys.readouterr().out
+    )
+
+
+def test_load_sticky_settings_from_future(tmp_path: Path):
+    """Tests that only the sticky fields are applied from a completed read"""
+    # GIVEN
+    scene_filename = str(tmp_path / "scene.mb")
+    settings = RenderSubmitterUISettings()
+    future = _completed_future(
+        {
+            "name": "My Job",
+            "frame_list": "1-10",
+            "project_path": "/some/project",
+            "submitter_name": "Other",
+            "not_a_field": True,
+        }
+    )
+
+    # WHEN
+    settings.load_sticky_settings(scene_filename, future)
+
+    # THEN
+    assert settings.name == "My Job"
+    assert settings.frame_list == "1-10"
+    assert settings.project_path == ""
+    assert settings.submitter_name == "Maya"
+    assert not hasattr(settings, "not_a_field")
+
+
+def test_save_and_load_sticky_settings(tmp_path: Path):
+    """Tests the sticky settings file format and that saved settings load back"""
+    # GIVEN
+    scene_filename = str(tmp_path / "scene.mb")
+    settings = RenderSubmitterUISettings(
+        name="My Job",
+        override_frame_range=True,
+        frame_list="1-10",
+        input_filenames=["/in/file.png"],
+        project_path="/some/project",
+    )
+
+    # WHEN
+    settings.save_sticky_settings(scene_filename)
+    loaded = RenderSubmitterUISettings()
+    loaded.load_sticky_settings(scene_filename)
+
+    # THEN
+    sticky_settings_file = tmp_path / "scene.deadline_render_settings.json"
+    assert sticky_settings_file.read_text(encoding="utf8") == (
+        "{\n"
+        ' "name": "My Job",\n'
+        ' "description": "",\n'
+        ' "override_frame_range": true,\n'
+        ' "frame_list": "1-10",\n'
+        ' "input_filenames": [\n'
+        '  "/in/file.png"\n'
+        " ],\n"
+        ' "input_directories": [],\n'
+        ' "output_directories": [],\n'
+        ' "include_adaptor_wheels": false\n'
+        "}"
+    )
+    assert loaded == RenderSubmitterUISettings(
+        name="My Job",
+        override_frame_range=True,
+        frame_list="1-10",
+        input_filenames=["/in/file.png"],
+    )